@@ -4,9 +4,245 @@ A comprehensive command-line tool for IP address calculations and network analys
 Licensed under the MIT License
 """
 
+import functools
 import ipaddress
+import re
 import sys
-from typing import Dict, Union, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, Hashable, Tuple, Union, Optional
+
+
+_BANNER = "=" * 42
+_IPV4_HEADER = "IPv4 Address Information".center(42)
+_IPV6_HEADER = "IPv6 Address Information".center(42)
+
+_HELP_TEXT = """
+IP Address Calculator (ipfx) - Network Analysis Tool
+
+Usage:
+    ipfx [address/prefix] [options]
+    
+Arguments:
+    address/prefix    IP address with CIDR notation (e.g., 192.168.1.1/24)
+    
+Options:
+    -h, --help       Show this help message and exit
+    -v, --verbose    Include the reverse DNS pointer
+    
+Examples:
+    ipfx 192.168.1.1/24       # Calculate IPv4 network
+    ipfx 2001:db8::1/64       # Calculate IPv6 network
+    ipfx                      # Enter interactive mode
+    
+Interactive Mode:
+    In interactive mode, you can enter multiple addresses:
+    address: 192.168.1.1/24
+    address: 10.0.0.1/8
+    address: exit            # Exit interactive mode
+""".strip()
+
+_EXIT_WORDS = frozenset(('exit', 'quit', 'q'))
+
+# Cheap shape check run before any ipaddress parsing: hex digits, colons and
+# dots, an optional IPv6 scope id, then a prefix length or dotted netmask.
+_INPUT_RE = re.compile(r'[0-9a-fA-F:.]+(?:%[^/]+)?/[0-9.]+')
+
+
+class _LRUCache:
+    """Small bounded least-recently-used mapping."""
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or None if absent."""
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return None
+        return self._data[key]
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry when full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+# Networks are keyed by (version, network address integer, prefix) so that
+# hosts in the same subnet share one network object.
+_NETWORK_CACHE = _LRUCache(1024)
+# Addresses are keyed by (version, address).
+_ADDRESS_CACHE = _LRUCache(1024)
+
+
+def _network_key(ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address],
+                 prefix: str) -> Optional[Tuple[int, int, str]]:
+    """
+    Derive the network cache key for an address/prefix pair.
+    
+    Args:
+        ip: Parsed IP address
+        prefix: Prefix length string
+        
+    Returns:
+        Cache key, or None if the input cannot be keyed cheaply
+    """
+    max_prefix = ip.max_prefixlen
+    if getattr(ip, "scope_id", None) or not (prefix.isascii() and prefix.isdigit()):
+        return None
+    prefixlen = int(prefix)
+    if prefixlen > max_prefix:
+        return None
+    all_ones = (1 << max_prefix) - 1
+    mask = (all_ones << (max_prefix - prefixlen)) & all_ones
+    return (ip.version, int(ip) & mask, prefix)
+
+
+def _parse_network_address(input_data: str, address: str, prefix: str, version: int) -> Tuple[
+        Union[ipaddress.IPv4Network, ipaddress.IPv6Network],
+        Union[ipaddress.IPv4Address, ipaddress.IPv6Address]]:
+    """
+    Build the network and address objects for an address/prefix pair.
+    
+    Both objects are served from bounded caches so repeated inputs, and
+    hosts within an already seen subnet, skip network construction.
+    
+    Args:
+        input_data: Address input in format "address/prefix"
+        address: Address part of input_data
+        prefix: Prefix part of input_data
+        version: IP address version (4 or 6)
+        
+    Returns:
+        Tuple of (network, address)
+        
+    Raises:
+        ValueError: If the address or prefix is invalid
+    """
+    if version == 4:
+        network_class, address_class = ipaddress.IPv4Network, ipaddress.IPv4Address
+    else:
+        network_class, address_class = ipaddress.IPv6Network, ipaddress.IPv6Address
+    
+    address_key = (version, address)
+    ip = _ADDRESS_CACHE.get(address_key)
+    if ip is None:
+        ip = address_class(address)
+        _ADDRESS_CACHE.put(address_key, ip)
+    
+    network_key = _network_key(ip, prefix)
+    network = _NETWORK_CACHE.get(network_key) if network_key is not None else None
+    if network is None:
+        network = network_class(input_data, strict=False)
+        if network_key is not None:
+            _NETWORK_CACHE.put(network_key, network)
+    
+    return network, ip
+
+
+@functools.lru_cache(maxsize=1024)
+def _network_scope(network: Union[ipaddress.IPv4Network, ipaddress.IPv6Network]) -> Tuple[bool, bool]:
+    """
+    Classify a network as private and/or global.
+    
+    Both properties walk the special-purpose range tables on every access,
+    so the result is computed once per network.
+    
+    Args:
+        network: IPv4Network or IPv6Network object
+        
+    Returns:
+        Tuple of (is_private, is_global)
+    """
+    return network.is_private, network.is_global
+
+
+@dataclass(slots=True)
+class Ipv4Info:
+    """IPv4 network information."""
+    
+    ipaddress: str
+    network_address: str
+    broadcast_address: str
+    host_count: int
+    is_private: bool
+    is_global: bool
+    is_network_address: bool
+    is_broadcast_address: bool
+    reverse: Optional[str]
+    cidr_notation: str
+    cisco_notation: str
+    ubuntu_subnet: str
+
+
+@dataclass(slots=True)
+class Ipv6Info:
+    """IPv6 network information."""
+    
+    network_address: str
+    is_private: bool
+    is_global: bool
+    is_link_local: bool
+    is_multicast: bool
+    reverse: Optional[str]
+    cidr_notation: str
+    ubuntu_notation: str
+
+
+# Info fields that are left as None when not computed and omitted from output.
+_OPTIONAL_FIELDS = frozenset({"reverse"})
+
+
+def _compile_formatter(name: str, header: str, info_class: type) -> Callable[[Any], str]:
+    """
+    Generate a formatter specialized for the fields of an info dataclass.
+    
+    Labels and padding are resolved once here, so each call is a single
+    f-string evaluation. Optional fields are omitted when their value is None.
+    All literal text is bound to names in the function's namespace, so the
+    generated template holds only names and never needs quoting or escaping.
+    
+    Args:
+        name: Name of the generated function
+        header: Centered header line
+        info_class: Dataclass whose fields are formatted
+        
+    Returns:
+        Function formatting an instance as a report block
+        
+    Raises:
+        ValueError: If the generated template contains quotes or backslashes
+    """
+    namespace: Dict[str, Any] = {
+        "_banner": _BANNER,
+        "_header": header,
+        "_nl": "\n",
+        "_empty": "",
+    }
+    parts = ["{_banner}{_nl}{_header}{_nl}{_banner}{_nl}"]
+    for field in fields(info_class):
+        label_name = f"_label_{field.name}"
+        namespace[label_name] = f"{field.name:20}: "
+        if field.name in _OPTIONAL_FIELDS:
+            parts.append(f"{{_empty if i.{field.name} is None else "
+                         f"{label_name} + str(i.{field.name}) + _nl}}")
+        else:
+            parts.append(f"{{{label_name}}}{{i.{field.name}}}{{_nl}}")
+    parts.append("{_banner}{_nl}")
+    template = "".join(parts)
+    if any(char in template for char in "'\"\\"):
+        raise ValueError(f"Formatter template must not contain quotes or backslashes: {template}")
+    source = f'def {name}(i):\n    return f"""{template}"""\n'
+    exec(source, namespace)
+    return namespace[name]
+
+
+_format_ipv4_info = _compile_formatter("_format_ipv4_info", _IPV4_HEADER, Ipv4Info)
+_format_ipv6_info = _compile_formatter("_format_ipv6_info", _IPV6_HEADER, Ipv6Info)
 
 
 class IPCalculator:
@@ -17,181 +253,179 @@ class IPCalculator:
         """
         Get IP address version (4 or 6).
         
+        Only the separators are inspected; full validation happens when the
+        network objects are built.
+        
         Args:
             address: IP address string
             
         Returns:
             4 for IPv4, 6 for IPv6, -1 for invalid
         """
-        try:
-            addr = ipaddress.ip_address(address)
-            return 4 if isinstance(addr, ipaddress.IPv4Address) else 6
-        except ValueError:
-            return -1
+        return 6 if ':' in address else (4 if '.' in address else -1)
     
     @staticmethod
-    def calculate_ipv4(network: ipaddress.IPv4Network, interface: ipaddress.IPv4Interface) -> Dict[str, Union[str, int, bool]]:
+    def calculate_ipv4(network: ipaddress.IPv4Network, ip: ipaddress.IPv4Address,
+                       verbose: bool = False) -> Ipv4Info:
         """
         Calculate IPv4 network information.
         
         Args:
             network: IPv4Network object
-            interface: IPv4Interface object
+            ip: IPv4Address object
+            verbose: Whether to include the reverse DNS pointer
             
         Returns:
-            Dictionary containing network information
+            Network information
         """
-        ip_addr = interface.ip
         network_address = network.network_address
         broadcast_address = network.broadcast_address
         host_count = network.num_addresses - 2  # Exclude network and broadcast addresses
+        is_private, is_global = _network_scope(network)
         
-        return {
-            "ipaddress": str(ip_addr),
-            "network_address": str(network_address),
-            "broadcast_address": str(broadcast_address),
-            "host_count": host_count,
-            "is_private": network.is_private,
-            "is_global": network.is_global,
-            "is_network_address": network_address == ip_addr,
-            "is_broadcast_address": broadcast_address == ip_addr,
-            "reverse": interface.reverse_pointer,
-            "cidr_notation": f"{ip_addr}/{network.prefixlen}",
-            "cisco_notation": f"{ip_addr} {network.netmask}",
-            "ubuntu_subnet": f"{network_address}/{network.prefixlen}"
-        }
+        return Ipv4Info(
+            ipaddress=str(ip),
+            network_address=str(network_address),
+            broadcast_address=str(broadcast_address),
+            host_count=host_count,
+            is_private=is_private,
+            is_global=is_global,
+            is_network_address=network_address == ip,
+            is_broadcast_address=broadcast_address == ip,
+            reverse=ip.reverse_pointer if verbose else None,
+            cidr_notation=f"{ip}/{network.prefixlen}",
+            cisco_notation=f"{ip} {network.netmask}",
+            ubuntu_subnet=f"{network_address}/{network.prefixlen}"
+        )
     
     @staticmethod
-    def calculate_ipv6(network: ipaddress.IPv6Network, interface: ipaddress.IPv6Interface) -> Dict[str, Union[str, bool]]:
+    def calculate_ipv6(network: ipaddress.IPv6Network, ip: ipaddress.IPv6Address,
+                       verbose: bool = False) -> Ipv6Info:
         """
         Calculate IPv6 network information.
         
         Args:
             network: IPv6Network object
-            interface: IPv6Interface object
+            ip: IPv6Address object
+            verbose: Whether to include the reverse DNS pointer
             
         Returns:
-            Dictionary containing network information
+            Network information
         """
         network_address = network.network_address
+        is_private, is_global = _network_scope(network)
         
-        return {
-            "network_address": str(network_address),
-            "is_private": network.is_private,
-            "is_global": network.is_global,
-            "is_link_local": network.is_link_local,
-            "is_multicast": network.is_multicast,
-            "reverse": network.reverse_pointer,
-            "cidr_notation": f"{network_address}/{network.prefixlen}",
-            "ubuntu_notation": f"{network_address}/{network.prefixlen}"
-        }
+        return Ipv6Info(
+            network_address=str(network_address),
+            is_private=is_private,
+            is_global=is_global,
+            is_link_local=network.is_link_local,
+            is_multicast=network.is_multicast,
+            reverse=network_address.reverse_pointer if verbose else None,
+            cidr_notation=f"{network_address}/{network.prefixlen}",
+            ubuntu_notation=f"{network_address}/{network.prefixlen}"
+        )
 
 
 class OutputFormatter:
     """Output formatting class."""
     
     @staticmethod
-    def print_ipv4_info(info: Dict[str, Union[str, int, bool]]) -> None:
+    def format_ipv4_info(info: Ipv4Info) -> str:
+        """Format IPv4 information for output."""
+        return _format_ipv4_info(info)
+    
+    @staticmethod
+    def format_ipv6_info(info: Ipv6Info) -> str:
+        """Format IPv6 information for output."""
+        return _format_ipv6_info(info)
+    
+    @staticmethod
+    def format_error(message: str) -> str:
+        """Format error message for output."""
+        return f"Error: {message}\n"
+    
+    @staticmethod
+    def print_ipv4_info(info: Ipv4Info) -> None:
         """Print IPv4 information in formatted output."""
-        print("=" * 42)
-        print("IPv4 Address Information".center(42))
-        print("=" * 42)
-        for key, value in info.items():
-            print(f"{key:20}: {value}")
-        print("=" * 42)
+        sys.stdout.write(OutputFormatter.format_ipv4_info(info))
     
     @staticmethod
-    def print_ipv6_info(info: Dict[str, Union[str, bool]]) -> None:
+    def print_ipv6_info(info: Ipv6Info) -> None:
         """Print IPv6 information in formatted output."""
-        print("=" * 42)
-        print("IPv6 Address Information".center(42))
-        print("=" * 42)
-        for key, value in info.items():
-            print(f"{key:20}: {value}")
-        print("=" * 42)
+        sys.stdout.write(OutputFormatter.format_ipv6_info(info))
     
     @staticmethod
     def print_error(message: str) -> None:
         """Print error message."""
-        print(f"Error: {message}")
+        sys.stdout.write(OutputFormatter.format_error(message))
     
     @staticmethod
     def print_help() -> None:
         """Print help message."""
-        help_text = """
-IP Address Calculator (ipfx) - Network Analysis Tool
-
-Usage:
-    ipfx [address/prefix] [options]
-    
-Arguments:
-    address/prefix    IP address with CIDR notation (e.g., 192.168.1.1/24)
-    
-Options:
-    -h, --help       Show this help message and exit
-    
-Examples:
-    ipfx 192.168.1.1/24       # Calculate IPv4 network
-    ipfx 2001:db8::1/64       # Calculate IPv6 network
-    ipfx                      # Enter interactive mode
-    
-Interactive Mode:
-    In interactive mode, you can enter multiple addresses:
-    address: 192.168.1.1/24
-    address: 10.0.0.1/8
-    address: exit            # Exit interactive mode
-        """
-        print(help_text.strip())
+        print(_HELP_TEXT)
 
 
 class IPAddressProcessor:
     """Main IP address processing class."""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
         self.calculator = IPCalculator()
         self.formatter = OutputFormatter()
+        # Rendered output keyed by (input, verbose).
+        self._render_cache = _LRUCache(512)
     
-    def process_address(self, input_data: str) -> int:
+    def _render_address(self, input_data: str) -> Tuple[int, str]:
         """
-        Process a single IP address input.
+        Calculate and format the output for a single IP address input.
         
         Args:
             input_data: Address input in format "address/prefix"
             
         Returns:
-            0 for success, -1 for error
+            Tuple of (0 for success or -1 for error, formatted output)
         """
-        try:
-            address, prefix = input_data.split('/')
-        except ValueError:
-            self.formatter.print_error("Invalid input format. Please use 'address/prefix'.")
-            return -1
+        if not _INPUT_RE.fullmatch(input_data):
+            return -1, self.formatter.format_error("Invalid input format. Please use 'address/prefix'.")
+        
+        address, _, prefix = input_data.rpartition('/')
         
         address_version = self.calculator.get_address_version(address)
         if address_version == -1:
-            self.formatter.print_error("Invalid address format.")
-            return -1
+            return -1, self.formatter.format_error("Invalid address format.")
         
         try:
-            if address_version == 4:
-                network = ipaddress.IPv4Network(f"{address}/{prefix}", strict=False)
-                interface = ipaddress.IPv4Interface(f"{address}/{prefix}")
-                info = self.calculator.calculate_ipv4(network, interface)
-                self.formatter.print_ipv4_info(info)
-            elif address_version == 6:
-                network = ipaddress.IPv6Network(f"{address}/{prefix}", strict=False)
-                interface = ipaddress.IPv6Interface(f"{address}/{prefix}")
-                info = self.calculator.calculate_ipv6(network, interface)
-                self.formatter.print_ipv6_info(info)
-            else:
-                self.formatter.print_error("Unknown address version.")
-                return -1
-                
+            network, ip = _parse_network_address(input_data, address, prefix, address_version)
         except ValueError as e:
-            self.formatter.print_error(f"Invalid network specification: {e}")
-            return -1
+            return -1, self.formatter.format_error(f"Invalid network specification: {e}")
         
-        return 0
+        if address_version == 4:
+            info = self.calculator.calculate_ipv4(network, ip, self.verbose)
+            return 0, self.formatter.format_ipv4_info(info)
+        info = self.calculator.calculate_ipv6(network, ip, self.verbose)
+        return 0, self.formatter.format_ipv6_info(info)
+    
+    def process_address(self, input_data: str) -> int:
+        """
+        Process a single IP address input.
+        
+        Output for repeated inputs is replayed from a cache.
+        
+        Args:
+            input_data: Address input in format "address/prefix"
+            
+        Returns:
+            0 for success, -1 for error
+        """
+        key = (input_data, self.verbose)
+        rendered = self._render_cache.get(key)
+        if rendered is None:
+            rendered = self._render_address(input_data)
+            self._render_cache.put(key, rendered)
+        exit_code, text = rendered
+        sys.stdout.write(text)
+        return exit_code
     
     def interactive_mode(self) -> int:
         """
@@ -200,20 +434,27 @@ class IPAddressProcessor:
         Returns:
             Exit code (0 for success)
         """
+        try:
+            import readline  # noqa: F401  # Enables line editing and history for input()
+        except ImportError:
+            pass
+        
         print("IP Address Calculator - Interactive Mode")
         print("Enter IP addresses in format 'address/prefix' or 'exit' to quit")
         print("-" * 50)
         
+        process = self.process_address
+        prompt = "address: "
         while True:
             try:
-                user_input = input("address: ").strip()
-                if user_input.lower() in ('exit', 'quit', 'q'):
+                user_input = input(prompt).strip()
+                if user_input.lower() in _EXIT_WORDS:
                     break
                 
                 if not user_input:
                     continue
                     
-                self.process_address(user_input)
+                process(user_input)
                 print()  # Add blank line for readability
                 
             except KeyboardInterrupt:
@@ -237,17 +478,20 @@ class IPAddressProcessor:
         return self.process_address(address)
 
 
-def main(input_address: Optional[str] = None) -> int:
+def main(input_address: Optional[str] = None,
+         processor: Optional[IPAddressProcessor] = None) -> int:
     """
     Main application entry point.
     
     Args:
         input_address: Optional IP address input
+        processor: Optional processor to reuse; a default one is created otherwise
         
     Returns:
         Exit code
     """
-    processor = IPAddressProcessor()
+    if processor is None:
+        processor = IPAddressProcessor()
     
     if input_address is not None:
         return processor.command_line_mode(input_address)
@@ -258,20 +502,24 @@ def main(input_address: Optional[str] = None) -> int:
 if __name__ == "__main__":
     args = sys.argv[1:]  # Exclude script name
     
+    if any(arg in ("-h", "--help") for arg in args):
+        OutputFormatter.print_help()
+        sys.exit(0)
+    
+    verbose = any(arg in ("-v", "--verbose") for arg in args)
+    args = [arg for arg in args if arg not in ("-v", "--verbose")]
+    processor = IPAddressProcessor(verbose)
+    
     if not args:
         # No arguments - enter interactive mode
-        exit_code = main()
+        exit_code = main(processor=processor)
         sys.exit(exit_code)
     
     # Process command line arguments
     for arg in args:
-        if arg in ("-h", "--help"):
-            OutputFormatter.print_help()
-            sys.exit(0)
-        
         # Process each address argument
         print(f"Processing: {arg}")
-        exit_code = main(arg)
+        exit_code = main(arg, processor=processor)
         if exit_code != 0:
             sys.exit(exit_code)
         print()  # Add blank line between results